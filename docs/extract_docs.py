@@ -7,8 +7,10 @@ Usage: python3 docs/extract_docs.py
 Output: docs/extracted/ folder with markdown versions of all reference docs.
 """
 
+import csv
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Windows consoles default to cp1252, which cannot print the arrows/glyphs in
 # our status lines — force UTF-8 so a cosmetic print can never abort extraction.
@@ -25,61 +27,80 @@ def extract_docx(filename, output_name):
         from docx import Document
         path = os.path.join(docs_dir, filename)
         if not os.path.exists(path):
-            print(f"  SKIP: {filename} not found")
-            return
+            return f"  SKIP: {filename} not found"
         doc = Document(path)
-        text = '\n'.join([p.text for p in doc.paragraphs if p.text.strip()])
         out_path = os.path.join(output_dir, output_name)
+        chars = 0
+        # Write paragraphs as they come instead of joining the whole document
+        # into one string first — same flat-memory pattern as extract_xlsx.
         with open(out_path, 'w', encoding='utf-8') as f:
-            f.write(text)
-        print(f"  OK: {filename} → extracted/{output_name} ({len(text)} chars)")
+            for p in doc.paragraphs:
+                if p.text.strip():
+                    if chars:
+                        f.write('\n')
+                        chars += 1
+                    f.write(p.text)
+                    chars += len(p.text)
+        return f"  OK: {filename} → extracted/{output_name} ({chars} chars)"
     except ImportError:
-        print("  ERROR: python-docx not installed. Run: pip install python-docx --break-system-packages")
+        return "  ERROR: python-docx not installed. Run: pip install python-docx --break-system-packages"
     except Exception as e:
-        print(f"  ERROR extracting {filename}: {e}")
+        return f"  ERROR extracting {filename}: {e}"
 
 def extract_xlsx(filename, output_name):
     try:
         import openpyxl
         path = os.path.join(docs_dir, filename)
         if not os.path.exists(path):
-            print(f"  SKIP: {filename} not found")
-            return
+            return f"  SKIP: {filename} not found"
         wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
-        lines = []
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            lines.append(f"\n## Sheet: {sheet_name}\n")
-            for row in ws.iter_rows(values_only=True):
-                row_text = ' | '.join([str(c) if c is not None else '' for c in row])
-                if row_text.strip(' |'):
-                    lines.append(row_text)
-        text = '\n'.join(lines)
         out_path = os.path.join(output_dir, output_name)
-        with open(out_path, 'w', encoding='utf-8') as f:
-            f.write(text)
-        print(f"  OK: {filename} → extracted/{output_name} ({len(text)} chars)")
+        # Stream each row straight to the output file instead of buffering the
+        # whole workbook — keeps memory flat no matter how large the sheet is
+        # (read_only mode already streams the input side). The per-row
+        # str()+join now runs through the C-implemented csv.writer instead of
+        # a pure-Python list comprehension per row.
+        with open(out_path, 'w', encoding='utf-8', newline='') as f:
+            w = csv.writer(f, delimiter='|', lineterminator='\n')
+            for sheet_name in wb.sheetnames:
+                ws = wb[sheet_name]
+                f.write(f"\n## Sheet: {sheet_name}\n\n")
+                for row in ws.iter_rows(values_only=True):
+                    if any(c is not None and str(c).strip(' |') for c in row):
+                        w.writerow(['' if c is None else c for c in row])
+            size = f.tell()
+        return f"  OK: {filename} → extracted/{output_name} ({size} chars)"
     except ImportError:
-        print("  ERROR: openpyxl not installed. Run: pip install openpyxl --break-system-packages")
+        return "  ERROR: openpyxl not installed. Run: pip install openpyxl --break-system-packages"
     except Exception as e:
-        print(f"  ERROR extracting {filename}: {e}")
+        return f"  ERROR extracting {filename}: {e}"
 
 def copy_drawio(filename, output_name):
     path = os.path.join(docs_dir, filename)
     if not os.path.exists(path):
-        print(f"  SKIP: {filename} not found")
-        return
+        return f"  SKIP: {filename} not found"
     import shutil
     out_path = os.path.join(output_dir, output_name)
     shutil.copy2(path, out_path)
     size = os.path.getsize(path)
-    print(f"  OK: {filename} → extracted/{output_name} ({size} bytes, read as XML)")
+    return f"  OK: {filename} → extracted/{output_name} ({size} bytes, read as XML)"
+
+# Each extraction is independent (own input file, own output file), so they
+# run concurrently — the zip/XML decompression releases the GIL, so threads
+# overlap fine. Status lines print in submission order regardless of which
+# job finishes first.
+JOBS = [
+    (extract_docx, 'Fair_Constitution_Labeled.docx', 'fair_constitution.md'),
+    (extract_docx, 'CGA_Architecture_Plan.docx', 'architecture_plan.md'),
+    (extract_xlsx, 'CGA_Constitutional_Roles_Forms_Chart.xlsx', 'roles_forms_chart.md'),
+    (extract_xlsx, 'Topic_Knowledge.xlsx', 'topic_knowledge.md'),
+    (copy_drawio, 'The_Chart.drawio', 'the_chart.xml'),
+    (copy_drawio, 'App_Flows.drawio', 'app_flows.xml'),
+]
 
 print("Extracting reference documents...")
-extract_docx('Fair_Constitution_Labeled.docx', 'fair_constitution.md')
-extract_docx('CGA_Architecture_Plan.docx', 'architecture_plan.md')
-extract_xlsx('CGA_Constitutional_Roles_Forms_Chart.xlsx', 'roles_forms_chart.md')
-extract_xlsx('Topic_Knowledge.xlsx', 'topic_knowledge.md')
-copy_drawio('The_Chart.drawio', 'the_chart.xml')
-copy_drawio('App_Flows.drawio', 'app_flows.xml')
+with ThreadPoolExecutor(max_workers=len(JOBS)) as pool:
+    futures = [pool.submit(fn, src, dst) for fn, src, dst in JOBS]
+    for future in futures:
+        print(future.result())
 print("\nDone. Read docs/extracted/ for constitutional context.")
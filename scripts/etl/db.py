@@ -62,12 +62,18 @@ def get_connection() -> psycopg2.extensions.connection:
 
 
 @contextmanager
-def get_cursor(conn: psycopg2.extensions.connection):
+def get_cursor(conn: psycopg2.extensions.connection, dict_rows: bool = True):
     """
-    Context manager yielding a DictCursor.
+    Context manager yielding a DictCursor (the default every caller expects).
     Commits the transaction on clean exit; rolls back on any exception.
+
+    dict_rows=False yields a plain tuple cursor instead — skips the per-row
+    dict-like wrapper DictCursor allocates, which is pure overhead on hot
+    paths that read RETURNING rows by position (the bulk helpers below).
     """
-    cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+    cur = conn.cursor(
+        cursor_factory=psycopg2.extras.DictCursor if dict_rows else None
+    )
     try:
         yield cur
         conn.commit()
@@ -94,12 +100,14 @@ def get_cursor(conn: psycopg2.extensions.connection):
 # inner Result computes the pipeline ONCE; ST_Centroid then references the
 # computed var. Verified in the plan output both ways. Do not remove it.
 #
-# WKB-FIRST (same dig): rows arrive with geom_wkb_hex whenever the importer
+# WKB-FIRST (same dig): rows arrive with geom_wkb whenever the importer
 # could encode the geometry client-side (all (Multi)Polygons — in practice
-# everything). decode(hex)+ST_GeomFromWKB is a near-1x transient; the
-# ST_GeomFromGeoJSON branch (json-c tree, ~10-30x the text for coordinate-
-# dense JSON — the other half of the 3.88 GB) remains only as the fallback
-# for non-polygonal/unconvertible geometries. CASE evaluates one branch.
+# everything). Shipped as raw bytea since the hex-text retirement: hex
+# doubled the bytes on the wire and made PG decode() every geometry before
+# ST_GeomFromWKB; raw bytes skip both. The ST_GeomFromGeoJSON branch
+# (json-c tree, ~10-30x the text for coordinate-dense JSON — the other half
+# of the 3.88 GB) remains only as the fallback for non-polygonal/
+# unconvertible geometries. CASE evaluates one branch.
 _JURISDICTION_INSERT_SQL = """
     INSERT INTO jurisdictions (
         name,
@@ -135,12 +143,12 @@ _JURISDICTION_INSERT_SQL = """
     FROM (VALUES %s) AS v(
         name, slug, iso_code, adm_level, parent_id, parent_assigned_via,
         source, geoboundaries_id, official_languages, timezone,
-        geom_geojson, geom_wkb_hex
+        geom_geojson, geom_wkb
     )
     CROSS JOIN LATERAL (
         SELECT ST_Multi(ST_MakeValid(ST_SetSRID(
-                   CASE WHEN v.geom_wkb_hex IS NOT NULL
-                        THEN ST_GeomFromWKB(decode(v.geom_wkb_hex, 'hex'))
+                   CASE WHEN v.geom_wkb IS NOT NULL
+                        THEN ST_GeomFromWKB(v.geom_wkb)
                         ELSE ST_GeomFromGeoJSON(v.geom_geojson)
                    END, 4326))) AS geom
         OFFSET 0
@@ -177,7 +185,7 @@ _JURISDICTION_TEMPLATE = """(
     %(official_languages)s,
     %(timezone)s,
     %(geom_geojson)s,
-    %(geom_wkb_hex)s
+    %(geom_wkb)s
 )"""
 
 
@@ -185,20 +193,22 @@ _GIANT_LOCK_CACHE: list = []
 
 # PG-side transient multipliers, field-calibrated 2026-08-02 (AUS ADM0:
 # 64 MB GeoJSON → 3.88 GB backend under the doubled pipeline ⇒ ~30x per
-# single evaluation; WKB hex decodes near-1x — statement text + bytea +
-# geometry + MakeValid copy ≈ 4x the hex). These size the ESTIMATED
+# single evaluation; WKB lands near-1x — statement text + bytea +
+# geometry + MakeValid copy ≈ 8x the raw bytes; same calibration, the
+# 4x-per-hex-char figure rebased onto raw WKB when hex shipping was
+# retired). These size the ESTIMATED
 # backend transient an INSERT will cost, which is what exclusivity must
 # key on — the old raw-payload trigger derived from the client flush
 # ceiling (~4 MB on a sliced budget) and exclusive-convoyed the whole
 # pool behind every mid-size feature.
 _PG_COST_GEOJSON = 30
-_PG_COST_WKB_HEX = 4
+_PG_COST_WKB     = 8
 
 
 def _giant_lock_bytes() -> int:
     """ESTIMATED-TRANSIENT budget above which an insert runs EXCLUSIVE.
-    Default 1 GiB — a monster's estimate (Nunavut-class WKB ≈ 200 MB hex
-    × 4) crosses it; the mid-size field (< ~250 MB hex / ~34 MB geojson)
+    Default 1 GiB — a monster's estimate (Nunavut-class WKB ≈ 100 MB raw
+    × 8) crosses it; the mid-size field (< ~125 MB WKB / ~34 MB geojson)
     stays shared at full pool width. CGA_ETL_GIANT_LOCK_BYTES overrides
     (same env var, now interpreted as the transient budget)."""
     if not _GIANT_LOCK_CACHE:
@@ -233,6 +243,10 @@ def bulk_insert_jurisdictions(
         geom_geojson    str  (raw GeoJSON `geometry` member as JSON text — passed
                               straight to PostgreSQL via ST_GeomFromGeoJSON; no
                               Python-side simplification or conversion. Phase L.)
+        geom_wkb        bytes | None  (client-side 2-D WKB, preferred over
+                              geom_geojson when present — shipped as raw bytea,
+                              half the wire bytes of the old hex text and no
+                              server-side decode() before ST_GeomFromWKB)
 
     Returns:
         List of UUID strings for rows that were actually inserted
@@ -248,11 +262,11 @@ def bulk_insert_jurisdictions(
 
     # Defensive: allow callers that haven't been Phase-J-updated to omit
     # parent_assigned_via — default to None and let the operator's review
-    # surface flag the un-tracked rows. geom_wkb_hex defaults for callers
+    # surface flag the un-tracked rows. geom_wkb defaults for callers
     # that still build geojson-only rows (global passes, synthetic Earth).
     for row in rows:
         row.setdefault("parent_assigned_via", None)
-        row.setdefault("geom_wkb_hex", None)
+        row.setdefault("geom_wkb", None)
         row.setdefault("geom_geojson", None)
 
     # THE GIANT GATE (2026-08-02, the two pg-backend OOM kills): chunking (the
@@ -269,10 +283,10 @@ def bulk_insert_jurisdictions(
     # xact lock, serializing ONLY the giants; every normal batch runs at
     # full pool width. The lock releases at commit.
     gj_bytes  = sum(len(r.get("geom_geojson") or "") for r in rows)
-    wkb_bytes = sum(len(r.get("geom_wkb_hex") or "") for r in rows)
-    est_transient = _PG_COST_GEOJSON * gj_bytes + _PG_COST_WKB_HEX * wkb_bytes
+    wkb_bytes = sum(len(r.get("geom_wkb") or b"") for r in rows)
+    est_transient = _PG_COST_GEOJSON * gj_bytes + _PG_COST_WKB * wkb_bytes
 
-    with get_cursor(conn) as cur:
+    with get_cursor(conn, dict_rows=False) as cur:
         # SHARED/EXCLUSIVE (operator, 2026-08-02 — "the single-threaded version
         # handled NZL, CAN, FRA, IND", on this same box): legacy's real
         # guarantee wasn't just one-giant-at-a-time, it was that a giant ran
@@ -304,7 +318,7 @@ def bulk_insert_jurisdictions(
             page_size=len(rows),  # one statement per call; caller controls byte-size
         )
 
-    inserted_ids = [row["id"] for row in result]
+    inserted_ids = [row[0] for row in result]   # (id, slug) tuples
     logger.debug("bulk_insert_jurisdictions: inserted %d / %d rows", len(inserted_ids), len(rows))
     return inserted_ids
 
@@ -313,8 +327,9 @@ def bulk_insert_jurisdictions(
 
 _SETTINGS_INSERT_SQL = """
     INSERT INTO constitutional_settings (jurisdiction_id, created_at, updated_at)
-    VALUES (%s, NOW(), NOW())
+    VALUES %s
     ON CONFLICT (jurisdiction_id) DO NOTHING
+    RETURNING jurisdiction_id
 """
 
 
@@ -328,17 +343,27 @@ def bulk_insert_constitutional_settings(
     All column values use the database-side defaults defined in the migration.
     ON CONFLICT DO NOTHING makes this fully idempotent.
 
+    One execute_values call instead of one statement per UUID — the old
+    per-row loop cost N round-trips for what is a trivial fixed-width row.
+    RETURNING only fires for rows that actually landed (conflicts are
+    skipped), so len(result) is the exact inserted count.
+
     Returns:
         Number of rows actually inserted.
     """
     if not jurisdiction_ids:
         return 0
 
-    inserted = 0
-    with get_cursor(conn) as cur:
-        for jid in jurisdiction_ids:
-            cur.execute(_SETTINGS_INSERT_SQL, (jid,))
-            inserted += cur.rowcount
+    with get_cursor(conn, dict_rows=False) as cur:
+        result = psycopg2.extras.execute_values(
+            cur,
+            _SETTINGS_INSERT_SQL,
+            [(jid,) for jid in jurisdiction_ids],
+            template="(%s, NOW(), NOW())",
+            page_size=1000,
+            fetch=True,        # accumulates RETURNING rows across all pages
+        )
+        inserted = len(result)
 
     logger.debug("bulk_insert_constitutional_settings: inserted %d rows", inserted)
     return inserted
@@ -346,14 +371,19 @@ def bulk_insert_constitutional_settings(
 
 # ─── Population bulk update ───────────────────────────────────────────────────
 
+# UNNEST over two parallel arrays instead of an execute_values VALUES list:
+# one short constant statement per call — no per-page SQL splicing on the
+# client, one parse/plan on the server regardless of row count. (A PREPARE/
+# EXECUTE pair would add nothing on top: there is exactly one statement per
+# call now, and callers are already input-chunk-bounded per the ETL paradigm.)
 _POPULATION_UPDATE_SQL = """
     UPDATE jurisdictions AS j
     SET
-        population      = v.population::bigint,
+        population      = v.population,
         population_year = 2023,
         updated_at      = NOW()
-    FROM (VALUES %s) AS v(id, population)
-    WHERE j.id = v.id::uuid
+    FROM UNNEST(%s::uuid[], %s::bigint[]) AS v(id, population)
+    WHERE j.id = v.id
     RETURNING j.id
 """
 
@@ -365,7 +395,8 @@ def bulk_update_populations(
     """
     Bulk-update the population column for a dict of {jurisdiction_uuid: count}.
 
-    Uses a single VALUES-based UPDATE rather than N individual statements.
+    Sends the whole map as two parallel arrays in a single UPDATE..FROM UNNEST
+    statement rather than N individual statements (or a spliced VALUES list).
     population_year is hard-coded to 2023 (WorldPop 2023 dataset).
 
     Returns:
@@ -374,18 +405,12 @@ def bulk_update_populations(
     if not population_map:
         return 0
 
-    rows = list(population_map.items())  # [(uuid, count), ...]
+    ids    = list(population_map.keys())
+    counts = [int(c) for c in population_map.values()]
 
-    with get_cursor(conn) as cur:
-        result = psycopg2.extras.execute_values(
-            cur,
-            _POPULATION_UPDATE_SQL,
-            rows,
-            template="(%s, %s)",
-            page_size=1000,
-            fetch=True,        # accumulates RETURNING rows across all pages
-        )
-        updated = len(result)  # true count regardless of page_size splitting
+    with get_cursor(conn, dict_rows=False) as cur:
+        cur.execute(_POPULATION_UPDATE_SQL, (ids, counts))
+        updated = len(cur.fetchall())   # true count via RETURNING
 
     logger.debug("bulk_update_populations: updated %d rows", updated)
     return updated
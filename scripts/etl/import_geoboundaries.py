@@ -30,6 +30,7 @@ import time
 import unicodedata
 from array import array
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -63,8 +64,10 @@ META_CSV           = GEOBOUNDARIES_ROOT / "geoBoundariesOpen-meta.csv"
 # that is a ~10x-30x transient over the text (field-calibrated: AUS ADM0,
 # 64 MB / 1.66M vertices, produced a 3.88 GB backend, kernel-killed). The
 # feature dict is ALREADY parsed here (ijson), so re-encoding it as WKB is a
-# straight structural walk: PG then does decode(hex) + ST_GeomFromWKB —
-# near-1x transients, no json tree at all. This is what makes Nunavut-class
+# straight structural walk: PG then does ST_GeomFromWKB on the raw bytea —
+# near-1x transients, no json tree at all. (Originally shipped as hex text
+# + server-side decode(); retired — raw bytes halve the wire payload and
+# skip the decode pass.) This is what makes Nunavut-class
 # monsters (CAN ADM1, ~250 MB one feature) insertable inside ANY sane
 # backend headroom, Raspberry-Pi included. Non-polygon geometry types (none
 # in geoBoundaries practice) and conversion failures fall back to the
@@ -88,8 +91,8 @@ def _wkb_polygon_body(out: bytearray, rings) -> None:
         out += flat.tobytes()
 
 
-def _geometry_to_wkb_hex(geom: dict) -> str:
-    """GeoJSON (Multi)Polygon geometry dict → 2-D little-endian WKB, hex text.
+def _geometry_to_wkb(geom: dict) -> bytes:
+    """GeoJSON (Multi)Polygon geometry dict → 2-D little-endian WKB, raw bytes.
 
     Raises on any non-polygonal type or malformed coordinates — the caller
     falls back to the GeoJSON path, so a raise here is safe, never fatal.
@@ -109,7 +112,7 @@ def _geometry_to_wkb_hex(geom: dict) -> str:
             _wkb_polygon_body(out, poly)
     else:
         raise ValueError(f"unsupported geometry type {gtype!r}")
-    return out.hex()
+    return bytes(out)
 
 # ─── Constants ────────────────────────────────────────────────────────────────
 
@@ -207,17 +210,26 @@ logger = logging.getLogger(__name__)
 
 # ─── Slug generation ─────────────────────────────────────────────────────────
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=131072)
 def _sanitize_name(name: str) -> str:
     """
     Normalize unicode, convert to ASCII, lowercase, replace non-alphanumeric
     with hyphens, collapse consecutive hyphens, strip leading/trailing hyphens.
 
     Example: "Île-de-France" → "ile-de-france"
+
+    Called once per feature, and admin names repeat heavily within a country
+    (shared prefixes, identical district names at different levels), so the
+    whole pure function is lru_cached and the pattern is compiled once at
+    module scope instead of leaning on re's internal cache.
     """
     normalized = unicodedata.normalize("NFKD", name)
     ascii_str   = normalized.encode("ascii", "ignore").decode("ascii")
     lower       = ascii_str.lower()
-    cleaned     = re.sub(r"[^a-z0-9]+", "-", lower)
+    cleaned     = _SLUG_RE.sub("-", lower)
     return cleaned.strip("-") or "unknown"
 
 
@@ -336,21 +348,29 @@ def discover_geoboundaries_files() -> list[tuple[str, int, Path]]:
         logger.error("GBOPEN_ROOT not found: %s", GBOPEN_ROOT)
         return results
 
-    for iso3_dir in sorted(GBOPEN_ROOT.iterdir()):
-        if not iso3_dir.is_dir():
-            continue
+    # os.scandir instead of Path.iterdir: DirEntry.is_dir() answers from the
+    # readdir d_type where the filesystem provides it, so the walk avoids a
+    # per-entry stat — and every stat here crosses the virtiofs boundary on
+    # the game box (the 11 s/call that motivated the memoisation above).
+    # Name filters are plain string tests; the single-digit ADM match needs
+    # no regex.
+    with os.scandir(GBOPEN_ROOT) as it:
+        iso3_dirs = sorted(
+            (e for e in it if len(e.name) == 3 and e.is_dir()),
+            key=lambda e: e.name,
+        )
+    for iso3_dir in iso3_dirs:
         iso3 = iso3_dir.name.upper()
-        if len(iso3) != 3:
-            continue   # skip README, desktop.ini, etc.
 
-        for adm_dir in sorted(iso3_dir.iterdir()):
-            if not adm_dir.is_dir():
-                continue
-            m = re.match(r'^ADM(\d)$', adm_dir.name, re.IGNORECASE)
-            if not m:
+        with os.scandir(iso3_dir.path) as it:
+            adm_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        for adm_dir in adm_dirs:
+            adm_name = adm_dir.name.upper()
+            if not (len(adm_name) == 4 and adm_name.startswith("ADM")
+                    and adm_name[3].isdigit()):
                 continue
-            adm_n        = int(m.group(1))
-            geojson_path = adm_dir / f"geoBoundaries-{iso3}-ADM{adm_n}.geojson"
+            adm_n        = int(adm_name[3])
+            geojson_path = Path(adm_dir.path) / f"geoBoundaries-{iso3}-ADM{adm_n}.geojson"
             # GeoJSON is primary; process_geojson_file falls back to .shp
             # automatically if the GeoJSON read fails or isn't present.
             results.append((iso3, adm_n, geojson_path))
@@ -409,16 +429,18 @@ def load_meta_index(meta_csv_path: Path, conn=None) -> dict:
     # error and the whole DB-write step silently no-ops.
     index: dict = {}
     db_rows_by_key: dict[tuple[str, int], tuple] = {}
-    for _, row in df.iterrows():
-        iso3   = str(row.get("boundaryISO", "")).strip().upper()
-        btype  = str(row.get("boundaryType", "")).strip()   # "ADM0", "ADM1", ...
+    # to_dict('records') converts the frame to plain dicts in one C-level
+    # pass — iterrows() built a throwaway Series per CSV row for what is a
+    # row-oriented walk anyway.
+    for rd in df.to_dict(orient="records"):
+        iso3   = str(rd.get("boundaryISO", "")).strip().upper()
+        btype  = str(rd.get("boundaryType", "")).strip()   # "ADM0", "ADM1", ...
         if not iso3 or not btype.startswith("ADM"):
             continue
         try:
             adm_n = int(btype[3:])
         except ValueError:
             continue
-        rd = row.to_dict()
         index[(iso3, adm_n)] = rd
 
         # Build the DB row tuple. Numeric columns from the CSV are strings
@@ -1755,7 +1777,7 @@ def build_parent_map_for_level(
 
 def find_parent_by_strategy_ladder(
     conn: psycopg2.extensions.connection,
-    geom_payload: str,
+    geom_payload: str | bytes,
     orphan_adm_level: int,
     iso3: str,
     payload_is_wkb: bool = False,
@@ -1834,13 +1856,13 @@ def find_parent_by_strategy_ladder(
     # GIST '&&' index bounds the ST_Intersects candidate set; at the direct
     # level the parents are states/provinces, not the giant country polygon.
     #
-    # WKB-first (2026-08-02): the orphan geometry arrives as WKB hex whenever
-    # the importer could encode it (payload_is_wkb) — decode+ST_GeomFromWKB is
-    # a near-1x transient, vs the ~10-30x json-c tree ST_GeomFromGeoJSON
-    # builds per call. These lookups run per ADM2+ FEATURE on every worker
-    # concurrently, so the geojson path was invisible standing PG pressure
-    # the insert gates never saw.
-    geo = ("ST_SetSRID(ST_GeomFromWKB(decode(%s, 'hex')), 4326)"
+    # WKB-first (2026-08-02): the orphan geometry arrives as raw WKB bytes
+    # whenever the importer could encode it (payload_is_wkb) — ST_GeomFromWKB
+    # on bytea is a near-1x transient, vs the ~10-30x json-c tree
+    # ST_GeomFromGeoJSON builds per call. These lookups run per ADM2+ FEATURE
+    # on every worker concurrently, so the geojson path was invisible standing
+    # PG pressure the insert gates never saw.
+    geo = ("ST_SetSRID(ST_GeomFromWKB(%s), 4326)"
            if payload_is_wkb else
            "ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326)")
     sql0 = f"""
@@ -2033,7 +2055,7 @@ def load_existing_slugs(conn: psycopg2.extensions.connection,
     PROGRESS, which is why the field flew and the tail OOM'd. A per-ISO
     child needs only its own country's slugs; the DB unique constraint
     remains the global guarantee."""
-    with get_cursor(conn) as cur:
+    with get_cursor(conn, dict_rows=False) as cur:
         if iso3:
             cur.execute(
                 "SELECT slug FROM jurisdictions WHERE deleted_at IS NULL AND slug LIKE %s",
@@ -2041,8 +2063,7 @@ def load_existing_slugs(conn: psycopg2.extensions.connection,
             )
         else:
             cur.execute("SELECT slug FROM jurisdictions WHERE deleted_at IS NULL")
-        rows = cur.fetchall()
-    return {str(row["slug"]) for row in rows}
+        return {row[0] for row in cur.fetchall()}
 
 
 # ─── GeoJSON feature processing ──────────────────────────────────────────────
@@ -2475,17 +2496,18 @@ def process_geojson_file(
                         name = meta_name
 
                 # WKB-first (2026-08-02): encode the already-parsed geometry
-                # dict as WKB hex — PG decodes it near-1x, no json-c tree.
-                # Non-polygon types / converter failures fall back to the
-                # GeoJSON text path (ST_GeomFromGeoJSON) unchanged.
-                geom_wkb_hex = None
+                # dict as raw WKB — PG ingests the bytea near-1x, no json-c
+                # tree, no hex decode. Non-polygon types / converter failures
+                # fall back to the GeoJSON text path (ST_GeomFromGeoJSON)
+                # unchanged.
+                geom_wkb = None
                 if geom_dict.get("type") in ("Polygon", "MultiPolygon"):
                     try:
-                        geom_wkb_hex = _geometry_to_wkb_hex(geom_dict)
+                        geom_wkb = _geometry_to_wkb(geom_dict)
                     except Exception as _wkb_exc:
                         log.warning("WKB conversion failed for %s '%s' (%s) — GeoJSON fallback",
                                     feat_iso3, name, _wkb_exc)
-                geom_geojson = (None if geom_wkb_hex
+                geom_geojson = (None if geom_wkb is not None
                                 else json.dumps(geom_dict, separators=(",", ":")))
 
                 if _RANGE_MODE:
@@ -2510,7 +2532,7 @@ def process_geojson_file(
                     "official_languages": official_langs,
                     "timezone":           "UTC",
                     "geom_geojson":       geom_geojson,
-                    "geom_wkb_hex":       geom_wkb_hex,
+                    "geom_wkb":           geom_wkb,
                 }
 
                 # Drop the parsed dict so the GC can reclaim ~300 MB for a
@@ -2561,8 +2583,9 @@ def process_geojson_file(
                     # CGA_ETL_INLINE_PARENTING=1 restores the old inline path.
                     if _INLINE_PARENTING:
                         parent_id, strategy = find_parent_by_strategy_ladder(
-                            conn, geom_wkb_hex or geom_geojson, adm_level_app, feat_iso3,
-                            payload_is_wkb=geom_wkb_hex is not None,
+                            conn, geom_wkb if geom_wkb is not None else geom_geojson,
+                            adm_level_app, feat_iso3,
+                            payload_is_wkb=geom_wkb is not None,
                         )
                         row["parent_id"]           = parent_id
                         row["parent_assigned_via"] = strategy
@@ -2574,7 +2597,7 @@ def process_geojson_file(
                         n_deferred += 1
 
                 # ── Add to batch; flush when full ──
-                rsz = len(geom_wkb_hex or geom_geojson)
+                rsz = len(geom_wkb if geom_wkb is not None else geom_geojson)
                 if batch and (
                     batch_bytes + rsz > BATCH_BYTE_LIMIT
                     or len(batch)     >= BATCH_ROW_LIMIT
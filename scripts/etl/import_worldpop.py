@@ -45,6 +45,7 @@ TIF on disk?" alone, and the population path is fully topological.
 
 import logging
 import os
+import struct
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -52,7 +53,6 @@ import numpy as np
 import psycopg2
 import psycopg2.extras
 import rasterio
-from rasterio.io import MemoryFile
 
 from db import get_connection, get_cursor
 import heartbeat
@@ -75,9 +75,9 @@ WORLDPOP_ROOT = DATA_ROOT / "worldpop_100m_latest"
 # legacy 2000 value so dev rigs see no behavior change.
 #
 # RASTER_BATCH_SIZE: how many tiles to INSERT per worldpop_rasters round-trip.
-# Each tile is ~300–500 KB as an in-memory GeoTIFF; the batch peak memory is
-# RASTER_BATCH_SIZE × ~400 KB on the etl side plus libpq buffer. The 'desktop'
-# tier keeps the legacy 50 value (~20 MB per batch).
+# Each tile is ≤ ~262 KB as raw raster WKB (256×256 float32 + fixed header);
+# the batch peak memory is RASTER_BATCH_SIZE × ~260 KB on the etl side plus
+# libpq buffer. The 'desktop' tier keeps the legacy 50 value (~13 MB per batch).
 from memory_budget import chunk_profile, detect_memory_budget_bytes
 
 _MEMORY_BUDGET           = detect_memory_budget_bytes()
@@ -213,15 +213,27 @@ def count_jurisdiction_rows_for_level(
     return int(row["n"]) if row else 0
 
 
+# Keyset cursor start value — sorts before every real UUID.
+_KEYSET_ID_ZERO = "00000000-0000-0000-0000-000000000000"
+
+
 def fetch_jurisdiction_ids_chunk(
     conn: psycopg2.extensions.connection,
     iso3: str,
     adm_level: int,
-    offset: int,
+    after_id: str,
     limit: int,
 ) -> list[str]:
     """
-    Fetch a chunk of jurisdiction UUIDs for one ADM level.
+    Fetch a chunk of jurisdiction UUIDs for one ADM level, keyset-paginated:
+    rows with id > after_id in id order. Pass _KEYSET_ID_ZERO for the first
+    chunk, then the last id of the previous chunk.
+
+    Why keyset and not OFFSET: for IND ADM6 (~650 k rows) the old
+    ORDER BY id LIMIT n OFFSET m had Postgres walk and discard the whole
+    prefix on every chunk — O(n²) across the level's ~325 chunks. id > %s
+    seeks straight into the pkey index, so the level's total fetch cost is
+    linear.
 
     We only need ids — population_within() reads the geometry directly from
     jurisdictions.geom inside the SQL UPDATE, so there is no point pulling
@@ -235,17 +247,29 @@ def fetch_jurisdiction_ids_chunk(
           AND  source     IN ('geoboundaries', 'synthetic')
           AND  deleted_at IS NULL
           AND  geom       IS NOT NULL
+          AND  id         > %s::uuid
         ORDER BY id
-        LIMIT  %s OFFSET %s
+        LIMIT  %s
     """
-    with get_cursor(conn) as cur:
-        cur.execute(sql, (iso3, adm_level, limit, offset))
+    # Tuple cursor: single-column result, so DictRow wrappers are pure
+    # overhead at DB_FETCH_CHUNK_SIZE rows per call (same trade as the
+    # bulk helpers in db.py).
+    with get_cursor(conn, dict_rows=False) as cur:
+        cur.execute(sql, (iso3, adm_level, after_id, limit))
         rows = cur.fetchall()
-    return [str(r["id"]) for r in rows]
+    return [r[0] for r in rows]
 
 
-def get_adm_levels_for_country(conn: psycopg2.extensions.connection, iso3: str) -> list[int]:
-    """Return sorted list of distinct adm_levels >= 1 present for a country.
+def get_adm_levels_by_iso(
+    conn: psycopg2.extensions.connection,
+    iso3_list: list[str],
+) -> dict[str, list[int]]:
+    """Return {iso3: sorted distinct adm_levels >= 1} for every listed country
+    in ONE grouped query — the run loop used to ask per country (twice: bar
+    pre-registration on its own throwaway connection, then the population
+    step), which at ~230 countries was hundreds of round-trips plus a TCP
+    connect each for the pre-register. Boundaries don't change during
+    Phase 2, so one snapshot up front serves the whole run.
 
     Sources accepted:
       - 'geoboundaries' — normal imported features
@@ -253,19 +277,20 @@ def get_adm_levels_for_country(conn: psycopg2.extensions.connection, iso3: str)
                           reresolve_parents.py), covers PRI today and any future
                           iso missing its country-level row in geoBoundaries
     """
-    with get_cursor(conn) as cur:
+    with get_cursor(conn, dict_rows=False) as cur:
         cur.execute("""
-            SELECT DISTINCT adm_level
+            SELECT iso_code,
+                   array_agg(DISTINCT adm_level ORDER BY adm_level) AS levels
             FROM   jurisdictions
-            WHERE  iso_code   = %s
+            WHERE  iso_code   = ANY(%s)
               AND  adm_level  >= 1
               AND  source     IN ('geoboundaries', 'synthetic')
               AND  deleted_at IS NULL
               AND  geom       IS NOT NULL
-            ORDER BY adm_level
-        """, (iso3,))
+            GROUP BY iso_code
+        """, (iso3_list,))
         rows = cur.fetchall()
-    return [r["adm_level"] for r in rows]
+    return {str(r[0]): [int(l) for l in r[1]] for r in rows}
 
 
 # ─── Phase Q: topological raster fallback ──────────────────────────────────
@@ -459,11 +484,42 @@ def process_adm_level(
     wp_progress   = progress.setdefault("worldpop", {})
     total_updated = 0
 
+    # Keyset cursor: the last id of the previous chunk. Chunks are processed
+    # strictly in id order, so each fetch seeks past the prior chunk instead
+    # of re-walking it (see fetch_jurisdiction_ids_chunk).
+    last_id = _KEYSET_ID_ZERO
+
     for chunk_idx in range(n_chunks):
         offset      = chunk_idx * DB_FETCH_CHUNK_SIZE
         chunk_label = f"chunk {chunk_idx + 1}/{n_chunks}"
         chunk_key   = f"{iso3}:adm{adm_level}:chunk{chunk_idx}"
 
+        # Resume: skip chunks already committed in a previous (interrupted) run.
+        # Checked BEFORE the heartbeat write — a resumed country with
+        # thousands of done chunk keys would otherwise pay one heartbeat
+        # file write per skipped chunk just to fast-forward. The bar still
+        # ticks below so the stacked-bars panel resumes at the real position
+        # instead of jumping from 0 when the first live chunk lands.
+        if wp_progress.get(chunk_key, {}).get("status") == "done":
+            prev_updated   = wp_progress[chunk_key].get("updated", 0)
+            total_updated += prev_updated
+            prev_last_id   = wp_progress[chunk_key].get("last_id")
+            if prev_last_id:
+                last_id = prev_last_id
+            else:
+                # Progress written before keyset pagination has no last_id —
+                # re-fetch this chunk's ids (cheap index-only seek) purely to
+                # advance the cursor; the idempotent UPDATE is not re-run.
+                prev_ids = fetch_jurisdiction_ids_chunk(
+                    conn, iso3, adm_level, last_id, DB_FETCH_CHUNK_SIZE,
+                )
+                if prev_ids:
+                    last_id = prev_ids[-1]
+            log.debug("%s adm%d [%s]: already done (%d rows) — skipping",
+                      iso3, adm_level, chunk_label, prev_updated)
+            heartbeat.bar_update(wp_bar_key, min(offset + DB_FETCH_CHUNK_SIZE, total_rows))
+            continue
+
         level_label = NATURAL_LABEL.get(adm_level, f"Level {adm_level}")
         heartbeat.write_current(
             id               = country_jur_id,
@@ -477,19 +533,12 @@ def process_adm_level(
             progress_total   = total_rows,
         )
 
-        # Resume: skip chunks already committed in a previous (interrupted) run
-        if wp_progress.get(chunk_key, {}).get("status") == "done":
-            prev_updated   = wp_progress[chunk_key].get("updated", 0)
-            total_updated += prev_updated
-            log.debug("%s adm%d [%s]: already done (%d rows) — skipping",
-                      iso3, adm_level, chunk_label, prev_updated)
-            continue
-
         ids = fetch_jurisdiction_ids_chunk(
-            conn, iso3, adm_level, offset, DB_FETCH_CHUNK_SIZE,
+            conn, iso3, adm_level, last_id, DB_FETCH_CHUNK_SIZE,
         )
         if not ids:
             break
+        last_id = ids[-1]
 
         with get_cursor(conn) as cur:
             # population_within() is declared as (VARCHAR(3), GEOMETRY, SMALLINT)
@@ -546,6 +595,7 @@ def process_adm_level(
         wp_progress[chunk_key] = {
             "status":    "done",
             "updated":   updated,
+            "last_id":   last_id,
             "rescued_via_territory_fallback": rescued,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
@@ -687,25 +737,62 @@ def validate_national_population(
 
 # ─── PostGIS raster loading ──────────────────────────────────────────────────
 
+# PostGIS raster WKB (RFC 2), little-endian. Fixed header: endiannes byte,
+# version, band count, geotransform doubles, srid, width, height. Each band:
+# one flags byte (pixel type in the low nibble, hasNodataValue at 0x40) then
+# the nodata value and pixels in the band's pixel size.
+_RASTER_WKB_HEADER = struct.Struct("<BHHddddddiHH")
+_RASTER_BAND_HDR   = struct.Struct("<Bf")
+_PT_32BF           = 9      # rt_api.h pixel-type enum: 32-bit float
+_BAND_HAS_NODATA   = 0x40
+
+
+def _tile_raster_wkb(data: np.ndarray, transform, nodata: float | None) -> bytes:
+    """
+    Serialize one float32 tile as PostGIS raster WKB for ST_RastFromWKB.
+
+    This replaces the old per-tile round-trip through an in-memory GeoTIFF
+    (rasterio MemoryFile write → libtiff encode → ST_FromGDALRaster → GDAL
+    parse inside PostGIS): the WKB layout is a fixed 61-byte header plus the
+    raw float32 pixel bytes, so serialization is one struct.pack and one
+    tobytes() with no image codec on either side. It also removes the
+    dependency on postgis.gdal_enabled_drivers for the load path.
+
+    The geotransform doubles (notably ipY, which band-grain idempotency
+    matches via ST_UpperLeftY) are written exactly as rasterio computed
+    them — identical to what the GeoTIFF carried before.
+    """
+    tile_h, tile_w = data.shape
+    header = _RASTER_WKB_HEADER.pack(
+        1,                            # endiannes: 1 = NDR (little-endian)
+        0,                            # format version
+        1,                            # band count
+        transform.a, transform.e,     # scaleX, scaleY
+        transform.c, transform.f,     # ipX (upper-left X), ipY (upper-left Y)
+        transform.b, transform.d,     # skewX, skewY
+        4326, tile_w, tile_h,
+    )
+    flags = _PT_32BF | (_BAND_HAS_NODATA if nodata is not None else 0)
+    band_hdr = _RASTER_BAND_HDR.pack(
+        flags, float(nodata) if nodata is not None else 0.0,
+    )
+    return header + band_hdr + np.ascontiguousarray(data, dtype="<f4").tobytes()
+
+
 def _insert_raster_batch(
     conn: psycopg2.extensions.connection,
     batch: list[tuple],
 ) -> None:
     """
-    Bulk-insert a list of (iso_code, year, resolution_m, tile_bytes) tuples
-    into worldpop_rasters using ST_FromGDALRaster.
+    Bulk-insert a list of (iso_code, year, resolution_m, tile_wkb) tuples
+    into worldpop_rasters via ST_RastFromWKB.
 
-    Each tile_bytes value is a raw GeoTIFF produced by rasterio MemoryFile —
-    PostGIS decodes it via its GDAL GeoTIFF driver and stores it as a raster.
+    Each tile_wkb value is PostGIS raster WKB built by _tile_raster_wkb —
+    parsed natively by the raster type with no GDAL driver involved (the old
+    ST_FromGDALRaster path needed postgis.gdal_enabled_drivers='GTiff' and
+    a session-level re-assert to survive DB recreation; both are gone).
     """
     with get_cursor(conn) as cur:
-        # Belt-and-braces: the GTiff GDAL driver is enabled at the DATABASE level
-        # by docker/postgres/init.sql (ALTER DATABASE ... SET postgis.gdal_enabled_drivers).
-        # That setting is lost if the database is ever dropped + recreated (init.sql
-        # only runs on a virgin data volume), which silently breaks EVERY
-        # ST_FromGDALRaster with "Could not open bytea with GDAL". Re-assert it on
-        # this session so the raster load is self-sufficient regardless of DB config.
-        cur.execute("SET postgis.gdal_enabled_drivers = 'GTiff'")
         psycopg2.extras.execute_values(
             cur,
             """
@@ -713,7 +800,7 @@ def _insert_raster_batch(
             VALUES %s
             """,
             batch,
-            template="(%s, %s, %s, ST_SetSRID(ST_FromGDALRaster(%s), 4326))",
+            template="(%s, %s, %s, ST_RastFromWKB(%s))",
             page_size=RASTER_BATCH_SIZE,
         )
 
@@ -733,8 +820,8 @@ def load_raster_to_db(
     """
     Load a WorldPop GeoTIFF into the worldpop_rasters table as 256×256 pixel tiles.
 
-    Each tile is written to an in-memory GeoTIFF via rasterio.MemoryFile, then
-    inserted using PostGIS's ST_FromGDALRaster — no external tools required.
+    Each tile is serialized directly to PostGIS raster WKB (_tile_raster_wkb)
+    and inserted via ST_RastFromWKB — no external tools required.
 
     Tiles that are entirely nodata or zero (ocean, uninhabited land) are skipped
     to keep storage compact.  For a country like the USA this typically eliminates
@@ -851,6 +938,12 @@ def load_raster_to_db(
         )
 
         tile_idx = 0
+        # One scratch buffer for every window read. Reading into a slice of
+        # this via out= means zero per-tile allocations — the old pattern
+        # allocated and freed up to 1 MB a million times per global run.
+        # Safe to reuse across iterations: _tile_raster_wkb copies the pixels
+        # out via tobytes() before the next read overwrites them.
+        buf = np.empty((RASTER_TILE_SIZE, RASTER_TILE_SIZE), dtype=np.float32)
         for row_off in row_steps:
             for col_off in col_steps:
                 tile_idx += 1
@@ -858,33 +951,39 @@ def load_raster_to_db(
                 tile_w = min(RASTER_TILE_SIZE, width  - col_off)
 
                 window = rasterio.windows.Window(col_off, row_off, tile_w, tile_h)
-                data   = src_ctx.read(1, window=window)
-
-                # Skip tiles that are entirely nodata / zero (ocean, uninhabited)
-                finite = data[~np.isnan(data)]
+                data   = buf[:tile_h, :tile_w]
+                src_ctx.read(1, window=window, out=data)
+
+                # Skip tiles that are entirely nodata / zero (ocean, uninhabited).
+                # One boolean mask + a masked reduction — the old chain
+                # (data[~np.isnan(data)] then finite[finite != nodata])
+                # materialized up to two tile-sized copies per tile, which at
+                # ~10⁶ tiles per global run was pure memory-bandwidth waste.
+                # Ocean fast path first: a single allocation-free max
+                # reduction. WorldPop pixels are non-negative and its nodata
+                # is negative, so a non-positive max proves the tile holds
+                # nothing worth storing — the common case (ocean dominates
+                # global coverage) never pays for the mask below. np.fmax
+                # ignores NaN; an all-NaN tile reduces to NaN, which fails
+                # the > 0 test. Guarded on nodata sign so a hypothetical
+                # positive-nodata raster falls through to the exact path.
+                if nodata is None or nodata <= 0:
+                    if not (float(np.fmax.reduce(data, axis=None)) > 0.0):
+                        continue
+                valid = np.isfinite(data)
                 if nodata is not None:
-                    finite = finite[finite != nodata]
-                if finite.size == 0 or float(finite.sum()) == 0.0:
+                    np.logical_and(valid, data != nodata, out=valid)
+                if not valid.any() or float(data.sum(where=valid, dtype=np.float64)) == 0.0:
                     continue
 
                 tile_transform = src_ctx.window_transform(window)
 
-                # Encode tile as an in-memory GeoTIFF for ST_FromGDALRaster
-                with MemoryFile() as mf:
-                    with mf.open(
-                        driver    = "GTiff",
-                        height    = tile_h,
-                        width     = tile_w,
-                        count     = 1,
-                        dtype     = "float32",
-                        crs       = src_ctx.crs,
-                        transform = tile_transform,
-                        nodata    = nodata,
-                    ) as dst:
-                        dst.write(data.astype("float32"), 1)
-                    tile_bytes = mf.read()
-
-                batch.append((iso3, year, resolution_m, psycopg2.Binary(tile_bytes)))
+                # Serialize straight to PostGIS raster WKB — no image codec.
+                # Raw bytes: psycopg2 adapts bytes to bytea natively (same as
+                # the geom_wkb payloads in db.py), so the psycopg2.Binary
+                # wrapper object per tile was pure overhead.
+                batch.append((iso3, year, resolution_m,
+                              _tile_raster_wkb(data, tile_transform, nodata)))
 
                 # Heartbeat fires either when a batch flushes OR every
                 # RASTER_HEARTBEAT_EVERY tiles, whichever comes first. This
@@ -995,6 +1094,14 @@ def import_worldpop(
         finally:
             _conn.close()
 
+    # One grouped snapshot of ADM levels for the whole run — boundaries do
+    # not change during Phase 2, and the old per-country lookup cost two
+    # round-trips per iso (one on a throwaway pre-register connection).
+    _conn = get_connection()
+    try:
+        adm_levels_by_iso = get_adm_levels_by_iso(_conn, iso3_list)
+    finally:
+        _conn.close()
 
     total_updated   = 0
     skipped_no_data = 0
@@ -1022,14 +1129,7 @@ def import_worldpop(
         # Operator sees the full per-country pipeline as pending bars the
         # moment the country activates, with each transitioning pending →
         # running → done in turn. Mirrors the geoboundaries pre-register.
-        try:
-            _conn_pre = get_connection()
-            try:
-                country_adm_levels = get_adm_levels_for_country(_conn_pre, iso3)
-            finally:
-                _conn_pre.close()
-        except Exception:
-            country_adm_levels = []
+        country_adm_levels = adm_levels_by_iso.get(iso3, [])
 
         tif_path_lookahead = find_worldpop_tif(iso3)
         if tif_path_lookahead is not None:
@@ -1173,7 +1273,7 @@ def import_worldpop(
                         break
 
                 # ── Step 2: run population_within() per ADM level ──
-                adm_levels = get_adm_levels_for_country(conn, iso3)
+                adm_levels = adm_levels_by_iso.get(iso3, [])
 
                 if level_filter:
                     adm_levels = [l for l in adm_levels if l in level_filter]
@@ -276,6 +276,20 @@ REGION_FALLBACKS: dict[str, list[str]] = {
 }
 
 
+# Pre-serialized JSON strings, built once at import. get_languages is called
+# once per feature during the geoBoundaries import (~2M calls at global
+# scale), and every call used to re-run json.dumps on the same small list —
+# the result set is static, so serialize each entry exactly once here.
+_DEFAULT_JSON = '["en"]'
+_ISO3_JSON: dict[str, str] = {
+    iso3: (json.dumps(langs) if langs else _DEFAULT_JSON)
+    for iso3, langs in ISO3_LANGUAGES.items()
+}
+_REGION_JSON: dict[str, str] = {
+    region: json.dumps(langs) for region, langs in REGION_FALLBACKS.items()
+}
+
+
 def get_languages(iso3: str, unsdg_region: str = "") -> str:
     """
     Return a JSON array string of ISO 639-1 language codes for a country.
@@ -293,11 +307,6 @@ def get_languages(iso3: str, unsdg_region: str = "") -> str:
     Returns:
         JSON string e.g. '["en"]' or '["fr", "nl"]'
     """
-    if iso3 in ISO3_LANGUAGES:
-        langs = ISO3_LANGUAGES[iso3]
-        return json.dumps(langs) if langs else '["en"]'
-
-    if unsdg_region and unsdg_region in REGION_FALLBACKS:
-        return json.dumps(REGION_FALLBACKS[unsdg_region])
-
-    return '["en"]'
+    return (_ISO3_JSON.get(iso3)
+            or (_REGION_JSON.get(unsdg_region) if unsdg_region else None)
+            or _DEFAULT_JSON)
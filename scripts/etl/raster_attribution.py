@@ -483,7 +483,11 @@ def attribute_grid(
                     if pop is None or not (pop > 0).any():
                         continue
                     if owners and len(owners) == 1 and owners[0][1] == "F":
-                        totals[owners[0][0]] += float(pop.sum())
+                        # Sum in float64: a 4096² window of float32 pixels
+                        # accumulated at float32 precision can drop people on
+                        # dense windows; the widening costs nothing (pixels
+                        # stay float32 — only the accumulator widens).
+                        totals[owners[0][0]] += float(pop.sum(dtype=np.float64))
                         continue
                     tfm = rio_transform.from_origin(_w.bounds[0], _w.bounds[3], px, px)
                     shape = pop.shape
@@ -994,7 +998,9 @@ def _process_window(
                     _prep = _prepared_for(_ri, _entry)
                     try:
                         if _prep is not None and _prep.contains(_wbox):
-                            totals[_ri] += float(pop[pop > 0].sum())
+                            # float64 accumulator — same widening as the
+                            # grid path's single-FULL-owner add.
+                            totals[_ri] += float(pop[pop > 0].sum(dtype=np.float64))
                             return
                     except Exception:
                         pass   # fall through to exact per-pixel work
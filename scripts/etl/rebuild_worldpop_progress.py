@@ -21,10 +21,14 @@ PROGRESS_FILE = Path("/etl/progress.json")
 def main():
     conn = get_connection()
     with get_cursor(conn) as cur:
-        # Find all (iso_code, adm_level) pairs where population has been set
+        # Find all (iso_code, adm_level) pairs where population has been set.
+        # The window SUM gives each row its country's total in the same scan,
+        # so the per-country rollup needs no second sweep in Python.
         cur.execute("""
             SELECT iso_code, adm_level,
-                   COUNT(*) FILTER (WHERE population IS NOT NULL) AS updated_rows
+                   COUNT(*) FILTER (WHERE population IS NOT NULL) AS updated_rows,
+                   SUM(COUNT(*) FILTER (WHERE population IS NOT NULL))
+                       OVER (PARTITION BY iso_code)               AS country_total
             FROM jurisdictions
             WHERE source IN ('geoboundaries', 'synthetic')
               AND adm_level >= 1
@@ -53,7 +57,7 @@ def main():
     now = datetime.now(timezone.utc).isoformat()
     country_levels: dict[str, list[int]] = {}
 
-    for iso_code, adm_level, updated_rows in rows:
+    for iso_code, adm_level, updated_rows, country_total in rows:
         key = f"{iso_code}:adm{adm_level}"
         wp[key] = {
             "status":    "done",
@@ -61,15 +65,12 @@ def main():
             "timestamp": now,
         }
         country_levels.setdefault(iso_code, []).append(adm_level)
-
-    # Write top-level country key for each fully-processed country
-    for iso_code, levels in country_levels.items():
-        total_updated = sum(
-            wp[f"{iso_code}:adm{lvl}"]["updated"] for lvl in levels
-        )
+        # Top-level country key: the window SUM already carries the
+        # country total on every row, so the last level's write wins with
+        # the same value — no second sweep needed.
         wp[iso_code] = {
             "status":    "done",
-            "updated":   total_updated,
+            "updated":   int(country_total),
             "timestamp": now,
         }
 